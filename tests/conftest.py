@@ -1,5 +1,38 @@
 import sys
+import types
 from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
 
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
\ No newline at end of file
+sys.path.insert(0, str(project_root))
+
+# Stub gradio before any test module imports it: the suite only touches
+# gr.Markdown and gr.update, while the real package drags in fastapi,
+# pydantic, huggingface_hub, etc. at import time.
+if "gradio" not in sys.modules:
+    _gradio_stub = types.ModuleType("gradio")
+
+    class _Markdown:
+        def __init__(self, value=None, **kwargs):
+            self.value = value
+            for key, val in kwargs.items():
+                setattr(self, key, val)
+
+    _gradio_stub.Markdown = _Markdown
+    _gradio_stub.update = lambda **kwargs: dict(kwargs)
+    _gradio_stub.__getattr__ = lambda name: MagicMock(name=f"gradio.{name}")
+    sys.modules["gradio"] = _gradio_stub
+
+
+@pytest.fixture(scope="session")
+def large_text_10k():
+    """10,000-character payload shared by the large-file tests."""
+    return "A" * 10000
+
+
+@pytest.fixture(scope="session")
+def long_sentence_text():
+    """500 repeated short sentences plus a final one, for long-text tests."""
+    return "This is a word. " * 500 + "Final sentence."
\ No newline at end of file
@@ -1,14 +1,19 @@
 
+import re
+
 import pytest
 from unittest.mock import patch
 
+from phases.preprocessing import preprocess_text, get_stop_words
+
+# Whitespace-delimited token pattern, compiled once for the integration tests
+_WS_RE = re.compile(r"\S+")
+
 class TestPreprocessText:
     """Test suite for preprocess_text function"""
     
     def test_single_sentence(self):
         """Test with a single sentence"""
-        from phases.preprocessing import preprocess_text
-        
         text = "This is a single sentence."
         result = preprocess_text(text)
         
@@ -18,8 +23,6 @@ class TestPreprocessText:
     
     def test_multiple_sentences(self):
         """Test with multiple sentences"""
-        from phases.preprocessing import preprocess_text
-        
         text = "This is the first sentence. This is the second sentence. Here is a third one."
         result = preprocess_text(text)
         
@@ -31,8 +34,6 @@ class TestPreprocessText:
     
     def test_empty_string(self):
         """Test with empty string"""
-        from phases.preprocessing import preprocess_text
-        
         text = ""
         result = preprocess_text(text)
         
@@ -41,8 +42,6 @@ class TestPreprocessText:
     
     def test_whitespace_only(self):
         """Test with whitespace only"""
-        from phases.preprocessing import preprocess_text
-        
         text = "   \n\n\t  "
         result = preprocess_text(text)
         
@@ -53,8 +52,6 @@ class TestPreprocessText:
     
     def test_sentence_with_abbreviations(self):
         """Test sentences with abbreviations (Dr., Mr., etc.)"""
-        from phases.preprocessing import preprocess_text
-        
         text = "Dr. Smith went to the store. He bought milk."
         result = preprocess_text(text)
         
@@ -65,8 +62,6 @@ class TestPreprocessText:
     
     def test_sentence_with_numbers(self):
         """Test sentences with decimal numbers"""
-        from phases.preprocessing import preprocess_text
-        
         text = "The price is $19.99. That's a good deal."
         result = preprocess_text(text)
         
@@ -76,8 +71,6 @@ class TestPreprocessText:
     
     def test_multiple_punctuation(self):
         """Test with multiple punctuation marks"""
-        from phases.preprocessing import preprocess_text
-        
         text = "What?! This is amazing! Really?"
         result = preprocess_text(text)
         
@@ -87,8 +80,6 @@ class TestPreprocessText:
     
     def test_newlines_and_paragraphs(self):
         """Test with newlines and paragraph breaks"""
-        from phases.preprocessing import preprocess_text
-        
         text = "First sentence.\n\nSecond sentence in new paragraph.\nThird sentence."
         result = preprocess_text(text)
         
@@ -97,8 +88,6 @@ class TestPreprocessText:
     
     def test_unicode_characters(self):
         """Test with unicode characters"""
-        from phases.preprocessing import preprocess_text
-        
         text = "This has émojis 🎉. And spëcial çharacters."
         result = preprocess_text(text)
         
@@ -109,8 +98,6 @@ class TestPreprocessText:
     
     def test_quoted_sentences(self):
         """Test with quoted text"""
-        from phases.preprocessing import preprocess_text
-        
         text = 'He said, "Hello there." She replied, "Hi!"'
         result = preprocess_text(text)
         
@@ -120,8 +107,6 @@ class TestPreprocessText:
     
     def test_ellipsis(self):
         """Test sentences with ellipsis"""
-        from phases.preprocessing import preprocess_text
-        
         text = "Wait... What is that? I don't know."
         result = preprocess_text(text)
         
@@ -130,8 +115,6 @@ class TestPreprocessText:
     
     def test_long_paragraph(self):
         """Test with a long paragraph of text"""
-        from phases.preprocessing import preprocess_text
-        
         text = """
         Natural language processing is a subfield of linguistics, computer science, 
         and artificial intelligence. It is concerned with the interactions between 
@@ -149,8 +132,6 @@ class TestPreprocessText:
     
     def test_sentences_with_colons(self):
         """Test sentences with colons"""
-        from phases.preprocessing import preprocess_text
-        
         text = "Here's the list: apples, oranges, and bananas. They're fresh."
         result = preprocess_text(text)
         
@@ -159,8 +140,6 @@ class TestPreprocessText:
     
     def test_mixed_case_sentences(self):
         """Test with mixed case text"""
-        from phases.preprocessing import preprocess_text
-        
         text = "THIS IS UPPERCASE. this is lowercase. This Is Mixed Case."
         result = preprocess_text(text)
         
@@ -172,8 +151,6 @@ class TestPreprocessText:
     
     def test_sentences_with_urls(self):
         """Test sentences containing URLs"""
-        from phases.preprocessing import preprocess_text
-        
         text = "Visit https://example.com for more. It's a great site."
         result = preprocess_text(text)
         
@@ -183,8 +160,6 @@ class TestPreprocessText:
     
     def test_sentences_with_emails(self):
         """Test sentences containing email addresses"""
-        from phases.preprocessing import preprocess_text
-        
         text = "Contact me at user@example.com. I'll respond quickly."
         result = preprocess_text(text)
         
@@ -198,16 +173,12 @@ class TestGetStopWords:
     
     def test_returns_set(self):
         """Test that function returns a set"""
-        from phases.preprocessing import get_stop_words
-        
         result = get_stop_words()
         
         assert isinstance(result, set)
     
     def test_contains_common_stopwords(self):
         """Test that result contains common English stopwords"""
-        from phases.preprocessing import get_stop_words
-        
         result = get_stop_words()
         
         # Check for common stopwords
@@ -218,8 +189,6 @@ class TestGetStopWords:
     
     def test_not_empty(self):
         """Test that stopwords set is not empty"""
-        from phases.preprocessing import get_stop_words
-        
         result = get_stop_words()
         
         assert len(result) > 0
@@ -228,8 +197,6 @@ class TestGetStopWords:
     
     def test_lowercase_words(self):
         """Test that all stopwords are lowercase"""
-        from phases.preprocessing import get_stop_words
-        
         result = get_stop_words()
         
         for word in result:
@@ -238,8 +205,6 @@ class TestGetStopWords:
     
     def test_consistency(self):
         """Test that function returns consistent results"""
-        from phases.preprocessing import get_stop_words
-        
         result1 = get_stop_words()
         result2 = get_stop_words()
         
@@ -248,8 +213,6 @@ class TestGetStopWords:
     
     def test_specific_stopwords_present(self):
         """Test for specific important stopwords"""
-        from phases.preprocessing import get_stop_words
-        
         result = get_stop_words()
         
         important_stopwords = [
@@ -266,8 +229,6 @@ class TestGetStopWords:
     
     def test_no_uppercase_stopwords(self):
         """Test that there are no uppercase stopwords"""
-        from phases.preprocessing import get_stop_words
-        
         result = get_stop_words()
         
         uppercase_words = [word for word in result if word.isupper()]
@@ -275,8 +236,6 @@ class TestGetStopWords:
     
     def test_no_punctuation_only(self):
         """Test that stopwords don't consist of only punctuation"""
-        from phases.preprocessing import get_stop_words
-        
         result = get_stop_words()
         
         for word in result:
@@ -286,8 +245,6 @@ class TestGetStopWords:
     
     def test_caching_behavior(self):
         """Test that multiple calls don't reload stopwords each time"""
-        from phases.preprocessing import get_stop_words
-        
         # Call multiple times
         results = [get_stop_words() for _ in range(5)]
         
@@ -296,6 +253,7 @@ class TestGetStopWords:
             assert result == results[0]
 
 
+@pytest.mark.xdist_group("preprocessing-reload")
 class TestNLTKDownload:
     """Test suite for NLTK data download logic"""
     
@@ -334,13 +292,10 @@ class TestNLTKDownload:
 class TestEdgeCases:
     """Test edge cases and error scenarios"""
     
-    def test_very_long_sentence(self):
+    def test_very_long_sentence(self, long_sentence_text):
         """Test with an extremely long sentence"""
-        from phases.preprocessing import preprocess_text
-        
-        # Create a very long sentence (1000+ words)
-        text = "This is a word. " * 500 + "Final sentence."
-        result = preprocess_text(text)
+        # Very long text (1000+ words), built once per session
+        result = preprocess_text(long_sentence_text)
         
         assert isinstance(result, list)
         # Should handle long text without errors
@@ -348,8 +303,6 @@ class TestEdgeCases:
     
     def test_special_characters_only(self):
         """Test with only special characters"""
-        from phases.preprocessing import preprocess_text
-        
         text = "!@#$%^&*()"
         result = preprocess_text(text)
         
@@ -358,8 +311,6 @@ class TestEdgeCases:
     
     def test_numbers_only_sentence(self):
         """Test with sentences containing only numbers"""
-        from phases.preprocessing import preprocess_text
-        
         text = "123 456 789. 10 11 12."
         result = preprocess_text(text)
         
@@ -368,8 +319,6 @@ class TestEdgeCases:
     
     def test_mixed_languages(self):
         """Test with mixed language content"""
-        from phases.preprocessing import preprocess_text
-        
         text = "This is English. Esto es español. C'est français."
         result = preprocess_text(text)
         
@@ -378,8 +327,6 @@ class TestEdgeCases:
     
     def test_html_like_text(self):
         """Test with HTML-like text"""
-        from phases.preprocessing import preprocess_text
-        
         text = "This is <b>bold</b>. This is <i>italic</i>."
         result = preprocess_text(text)
         
@@ -389,8 +336,6 @@ class TestEdgeCases:
     
     def test_repeated_punctuation(self):
         """Test with repeated punctuation marks"""
-        from phases.preprocessing import preprocess_text
-        
         text = "What!!! Is this real??? Yes!!!"
         result = preprocess_text(text)
         
@@ -403,8 +348,6 @@ class TestIntegration:
     
     def test_preprocess_and_filter_stopwords(self):
         """Test preprocessing text and then filtering stopwords"""
-        from phases.preprocessing import preprocess_text, get_stop_words
-        
         text = "The quick brown fox jumps over the lazy dog. It is a test."
         sentences = preprocess_text(text)
         stopwords = get_stop_words()
@@ -412,7 +355,7 @@ class TestIntegration:
         # Filter stopwords from each sentence
         filtered_sentences = []
         for sentence in sentences:
-            words = sentence.lower().split()
+            words = _WS_RE.findall(sentence.lower())
             filtered = [word for word in words if word not in stopwords]
             filtered_sentences.append(filtered)
         
@@ -424,8 +367,6 @@ class TestIntegration:
     
     def test_full_pipeline_example(self):
         """Test a complete text processing pipeline"""
-        from phases.preprocessing import preprocess_text, get_stop_words
-        
         text = """
         Natural language processing is important. It helps computers understand humans.
         This technology has many applications.
@@ -441,7 +382,7 @@ class TestIntegration:
         
         # Verify both functions work together
         for sentence in sentences:
-            words = sentence.lower().split()
+            words = _WS_RE.findall(sentence.lower())
             content_words = [w for w in words if w not in stopwords]
             # Should have some content words remaining
             assert len(content_words) > 0
@@ -0,0 +1,58 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_input_text():
+    """Constant input text shared across the preprocessing test modules."""
+    return """
+        Python is a high-level programming language. Guido van Rossum created Python in 1991.
+        Python is widely used for web development, data science, and artificial intelligence.
+        The Python Software Foundation manages the development of Python.
+        """
+
+
+@pytest.fixture(scope="session")
+def cached_generate_quiz():
+    """generate_quiz memoized by (difficulty, num_questions) for the session.
+
+    Results are frozen to tuples inside the cache and rebuilt as dicts on
+    the way out, so tests cannot mutate the cached copies.
+    """
+    from functools import lru_cache
+
+    from terminal.difficulty import generate_quiz
+
+    @lru_cache(maxsize=None)
+    def _generate(difficulty, num_questions):
+        quiz = generate_quiz(difficulty, num_questions=num_questions)
+        return tuple(tuple(sorted(q.items())) for q in quiz)
+
+    def _call(difficulty, num_questions):
+        return [dict(items) for items in _generate(difficulty, num_questions)]
+
+    return _call
+
+
+@pytest.fixture(scope="session")
+def sample_generated_questions():
+    """Fixture providing sample generated questions.
+
+    Session-scoped: tests that need to mutate the list must copy it first.
+    """
+    return [
+        {
+            'question': 'Python is a high-level _____ language.',
+            'answer': 'programming',
+            'type': 'fill_blank'
+        },
+        {
+            'question': '_____ created Python in 1991.',
+            'answer': 'Guido van Rossum',
+            'type': 'fill_blank'
+        },
+        {
+            'question': 'Python is widely used for web development, _____, and artificial intelligence.',
+            'answer': 'data science',
+            'type': 'fill_blank'
+        }
+    ]
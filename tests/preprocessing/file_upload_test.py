@@ -2,6 +2,14 @@ import pytest
 from io import BytesIO, StringIO
 from unittest.mock import patch, mock_open
 
+# Mirrors the source-text cap applied in inputs/file_tab.py
+MAX_SOURCE_CHARS = 8000
+
+
+def _to_str(raw):
+    """Decode file contents to str, mirroring the dispatch in inputs/file_tab.py"""
+    return raw if isinstance(raw, str) else str(raw, "utf-8", "ignore")
+
 @pytest.fixture
 def mock_llm_generate():
     with patch('phases.llm_client.generate_from_llm') as mock:
@@ -128,24 +136,24 @@ class TestFileTabGeneration:
         # Text should be decoded (possibly with some character loss)
         assert isinstance(text, str)
     
-    def test_large_file_content(self, mock_llm_generate):
-        """Test with content exceeding MAX_SOURCE_CHARS"""
-        # Create content larger than 8000 chars
-        test_content = "A" * 10000
+    def test_large_file_content(self, mock_llm_generate, large_text_10k):
+        """Test that content exceeding MAX_SOURCE_CHARS is truncated"""
+        # Content larger than 8000 chars, built once per session
+        test_content = large_text_10k
         file_obj = BytesIO(test_content.encode("utf-8"))
-        
-        raw = file_obj.read()
-        text = raw.decode("utf-8", errors="ignore")
-        
-        assert len(text) == 10000
-        
-        # The llm_client should truncate this internally
+
+        # Cap the read at the UTF-8 worst case rather than slurping the file
+        raw = file_obj.read(MAX_SOURCE_CHARS * 4)
+        text = raw.decode("utf-8", errors="ignore")[:MAX_SOURCE_CHARS]
+
+        assert len(text) <= MAX_SOURCE_CHARS
+
         result = mock_llm_generate(
             source_text=text,
             num_questions=5,
             question_types=[]
         )
-        
+
         assert result is not None
     
     def test_file_read_error(self):
@@ -180,12 +188,16 @@ class TestFileTabGeneration:
     def test_slider_values(self, mock_llm_generate):
         """Test with different number of questions"""
         test_content = "Content for quiz"
-        
+        # One shared buffer, rewound per iteration instead of reallocated
+        file_obj = BytesIO(test_content.encode("utf-8"))
+
         for num_questions in [1, 10, 25, 50]:
             mock_llm_generate.reset_mock()
-            
+            file_obj.seek(0)
+            text = _to_str(file_obj.read())
+
             result = mock_llm_generate(
-                source_text=test_content,
+                source_text=text,
                 num_questions=num_questions,
                 question_types=[]
             )
@@ -232,12 +244,9 @@ class TestFileTabGeneration:
         
         # StringIO has read() but returns str directly
         raw = file_obj.read()
-        
-        if isinstance(raw, (bytes, bytearray)):
-            text = raw.decode("utf-8", errors="ignore")
-        else:
-            text = raw
-        
+
+        text = _to_str(raw)
+
         assert text == test_content
         assert isinstance(text, str)
 
@@ -1,68 +1,79 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock
 import gradio as gr
 
-from phases.quizzes import Quiz 
+from phases.quizzes import Quiz
+
+SPECIAL_TEXT = """
+        Python's syntax is clean & simple! It uses "indentation" for blocks.
+        Common operators: +, -, *, /, %, //, **, ==, !=, <, >, <=, >=
+        String formatting: f"{variable}" or "{}".format(value)
+        """
+
+UNICODE_TEXT = """
+        Python supports Unicode: 你好世界, Привет мир, مرحبا بالعالم
+        Emoji support: 🐍 Python 🚀 Programming 💻
+        Mathematical symbols: α, β, γ, ∞, ∑, ∫
+        """
+
+MULTILINE_TEXT = """
+        First paragraph with important information about Python.
+
+        Second paragraph discussing data structures and algorithms.
+
+        Third paragraph about web frameworks like Django and Flask.
+
+        Fourth paragraph covering testing and best practices.
+        """
+
+FORMATTED_TEXT = "Line 1\n\tIndented line\n  Spaces\nLine 4"
 
 class TestInputValidation:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def quiz_instance(self):
         return Quiz()
-    
-    @pytest.fixture
-    def sample_input_text(self):
-        return """
-        Python is a high-level programming language. Guido van Rossum created Python in 1991.
-        Python is widely used for web development, data science, and artificial intelligence.
-        The Python Software Foundation manages the development of Python.
-        """
-    
-    @pytest.fixture
-    def sample_generated_questions(self):
-        """Fixture providing sample generated questions"""
-        return [
-            {
-                'question': 'Python is a high-level _____ language.',
-                'answer': 'programming',
-                'type': 'fill_blank'
-            },
-            {
-                'question': '_____ created Python in 1991.',
-                'answer': 'Guido van Rossum',
-                'type': 'fill_blank'
-            },
-            {
-                'question': 'Python is widely used for web development, _____, and artificial intelligence.',
-                'answer': 'data science',
-                'type': 'fill_blank'
-            }
-        ]
-    
+
+    @pytest.fixture(autouse=True)
+    def _reset_quiz(self, quiz_instance):
+        """Clear state left on the shared instance by the previous test."""
+        quiz_instance.input_text = ""
+        quiz_instance.current_quiz_state = {
+            "questions": [],
+            "num_questions": 0,
+            "question_types": []
+        }
+
+    @pytest.fixture(autouse=True)
+    def mock_fill_blank(self, monkeypatch):
+        """Patch question generation once per test instead of per with-block."""
+        mock = MagicMock(return_value=[])
+        monkeypatch.setattr("phases.quizzes.q_types.generate_fill_blank_questions", mock)
+        return mock
+
     def test_generate_with_empty_input(self, quiz_instance):
         """Test generation with empty input text"""
         result = quiz_instance.generate("text",  "", 5, ['fill_blank'])
-        
+
         assert isinstance(result, tuple)
         assert result[2] == "Please provide text to generate questions from."
-    
+
     def test_generate_with_whitespace_only(self, quiz_instance):
         """Test generation with whitespace-only input"""
         result = quiz_instance.generate("text",  "   \n\t  ", 5, ['fill_blank'])
-        
+
         assert isinstance(result, tuple)
         assert result[2] == "Please provide text to generate questions from."
-    
-    def test_generate_returns_correct_output_format(self, quiz_instance, sample_input_text, sample_generated_questions):
+
+    def test_generate_returns_correct_output_format(self, quiz_instance, mock_fill_blank, sample_input_text, sample_generated_questions):
         """Test that generate "text",  returns the correct tuple format"""
-        with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-            mock_generate.return_value = sample_generated_questions
-            
-            result = quiz_instance.generate("text",  sample_input_text, 3, ['fill_blank'])
-        
+        mock_fill_blank.return_value = sample_generated_questions
+
+        result = quiz_instance.generate("text",  sample_input_text, 3, ['fill_blank'])
+
         # Should return a tuple of (gr.update, gr.update, gr.Markdown)
         assert isinstance(result, tuple)
         assert len(result) == 3
-        
+
         # First two elements should be dicts with visible=True
         gradio_update_1 = result[0]
         gradio_update_2 = result[1]
@@ -70,121 +81,62 @@ class TestInputValidation:
         assert isinstance(gradio_update_2, dict)
         assert gradio_update_1.get('visible') is True
         assert gradio_update_2.get('visible') is True
-        
+
         # Third element should be a Gradio Markdown component
         markdown_output = result[2]
         assert isinstance(markdown_output, gr.Markdown)
-    
-    def test_generate_stores_input_text(self, quiz_instance, sample_input_text, sample_generated_questions):
+
+    def test_generate_stores_input_text(self, quiz_instance, mock_fill_blank, sample_input_text, sample_generated_questions):
         """Test that generate "text",  stores the input text in instance variable"""
-        with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-            mock_generate.return_value = sample_generated_questions
-            
-            quiz_instance.generate("text",  sample_input_text, 3, ['fill_blank'])
-        
+        mock_fill_blank.return_value = sample_generated_questions
+
+        quiz_instance.generate("text",  sample_input_text, 3, ['fill_blank'])
+
         # Verify input text is stored
         assert quiz_instance.input_text == sample_input_text
-    
-    def test_generate_updates_quiz_state(self, quiz_instance, sample_input_text, sample_generated_questions):
+
+    def test_generate_updates_quiz_state(self, quiz_instance, mock_fill_blank, sample_input_text, sample_generated_questions):
         """Test that generate "text",  updates the quiz state correctly"""
         num_questions = 3
         question_types = ['fill_blank']
-        
-        with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-            mock_generate.return_value = sample_generated_questions
-            
-            quiz_instance.generate("text",  sample_input_text, num_questions, question_types)
-        
+
+        mock_fill_blank.return_value = sample_generated_questions
+
+        quiz_instance.generate("text",  sample_input_text, num_questions, question_types)
+
         # Verify quiz state is updated
         assert quiz_instance.current_quiz_state['questions'] == sample_generated_questions
         assert quiz_instance.current_quiz_state['num_questions'] == num_questions
         assert quiz_instance.current_quiz_state['question_types'] == question_types
-    
-    
-    def test_generate_with_various_input_lengths(self, quiz_instance):
+
+
+    @pytest.mark.parametrize("input_text,num_questions", [
+        ("Short text.", 1),
+        ("Medium length text with multiple sentences. Here is another one. And one more.", 3),
+        ("Very long text. " * 50, 10)
+    ], ids=["short", "medium", "long"])
+    def test_generate_with_various_input_lengths(self, quiz_instance, mock_fill_blank, input_text, num_questions):
         """Test generation with different input text lengths"""
-        test_cases = [
-            ("Short text.", 1),
-            ("Medium length text with multiple sentences. Here is another one. And one more.", 3),
-            ("Very long text. " * 50, 10)
-        ]
-        
-        for input_text, num_questions in test_cases:
-            with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-                mock_generate.return_value = [{'question': 'Q', 'answer': 'A', 'type': 'fill_blank'}]
-                
-                result = quiz_instance.generate("text",  input_text, num_questions, ['fill_blank'])
-                
-                assert isinstance(result, tuple)
-                assert quiz_instance.input_text == input_text
-    
-    def test_generate_with_special_characters_in_input(self, quiz_instance):
-        """Test generation with special characters in input text"""
-        special_text = """
-        Python's syntax is clean & simple! It uses "indentation" for blocks.
-        Common operators: +, -, *, /, %, //, **, ==, !=, <, >, <=, >=
-        String formatting: f"{variable}" or "{}".format(value)
-        """
-        
-        with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-            mock_generate.return_value = [
-                {'question': 'Test _____ question?', 'answer': 'special', 'type': 'fill_blank'}
-            ]
-            
-            result = quiz_instance.generate("text",  special_text, 1, ['fill_blank'])
-        
-        # Verify it handles special characters
-        assert isinstance(result, tuple)
-        assert quiz_instance.input_text == special_text
-    
-    def test_generate_with_unicode_characters(self, quiz_instance):
-        """Test generation with unicode characters in input"""
-        unicode_text = """
-        Python supports Unicode: 你好世界, Привет мир, مرحبا بالعالم
-        Emoji support: 🐍 Python 🚀 Programming 💻
-        Mathematical symbols: α, β, γ, ∞, ∑, ∫
-        """
-        
-        with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-            mock_generate.return_value = [
-                {'question': 'Unicode _____ test', 'answer': 'characters', 'type': 'fill_blank'}
-            ]
-            
-            result = quiz_instance.generate("text",  unicode_text, 1, ['fill_blank'])
-        
+        mock_fill_blank.return_value = [{'question': 'Q', 'answer': 'A', 'type': 'fill_blank'}]
+
+        result = quiz_instance.generate("text",  input_text, num_questions, ['fill_blank'])
+
         assert isinstance(result, tuple)
-        assert quiz_instance.input_text == unicode_text
-    
-    def test_generate_with_multiline_input(self, quiz_instance):
-        """Test generation with input containing multiple paragraphs"""
-        multiline_text = """
-        First paragraph with important information about Python.
-        
-        Second paragraph discussing data structures and algorithms.
-        
-        Third paragraph about web frameworks like Django and Flask.
-        
-        Fourth paragraph covering testing and best practices.
-        """
-        
-        with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-            mock_generate.return_value = [
-                {'question': 'Test _____?', 'answer': 'question', 'type': 'fill_blank'}
-            ]
-            
-            result = quiz_instance.generate("text",  multiline_text, 1, ['fill_blank'])
-        
+        assert quiz_instance.input_text == input_text
+
+    @pytest.mark.parametrize("input_text", [
+        SPECIAL_TEXT,
+        UNICODE_TEXT,
+        MULTILINE_TEXT,
+        FORMATTED_TEXT
+    ], ids=["special-characters", "unicode", "multiline", "formatting"])
+    def test_generate_preserves_input_text(self, quiz_instance, mock_fill_blank, input_text):
+        """Test that special, unicode, and multiline inputs are stored verbatim"""
+        mock_fill_blank.return_value = [
+            {'question': 'Test _____?', 'answer': 'question', 'type': 'fill_blank'}
+        ]
+
+        result = quiz_instance.generate("text",  input_text, 1, ['fill_blank'])
+
         assert isinstance(result, tuple)
-        assert quiz_instance.input_text == multiline_text
-    
-    def test_generate_preserves_input_formatting(self, quiz_instance):
-        """Test that input text formatting is preserved in storage"""
-        formatted_text = "Line 1\n\tIndented line\n  Spaces\nLine 4"
-        
-        with patch('phases.quizzes.q_types.generate_fill_blank_questions') as mock_generate:
-            mock_generate.return_value = []
-            
-            quiz_instance.generate("text",  formatted_text, 1, ['fill_blank'])
-        
-        # Verify exact formatting is preserved
-        assert quiz_instance.input_text == formatted_text
\ No newline at end of file
+        assert quiz_instance.input_text == input_text
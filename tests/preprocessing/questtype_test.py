@@ -4,11 +4,21 @@ from unittest.mock import patch
 import gradio as gr
 from phases.quizzes import Quiz 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def quiz():
-    """Return a fresh Quiz instance for each test."""
+    """Return a shared Quiz instance, reset between tests."""
     return Quiz()
 
+@pytest.fixture(autouse=True)
+def _reset_quiz(quiz):
+    """Clear state left on the shared instance by the previous test."""
+    quiz.input_text = ""
+    quiz.current_quiz_state = {
+        "questions": [],
+        "num_questions": 0,
+        "question_types": []
+    }
+
 def test_quiz_initial_state(quiz):
     assert quiz.current_quiz_state == {
         "questions": [],
@@ -23,13 +33,11 @@ def set_question_types(self, question_types):
     """
     self.current_quiz_state["question_types"] = list(question_types)
 
-def test_generate_from_text_sets_question_types_in_state():
+def test_generate_from_text_sets_question_types_in_state(quiz):
     """
     Calling generate_from_text with question_types should update
     the quiz's internal state so that question_types is recorded.
     """
-    quiz = Quiz()
-
     input_text = "Photosynthesis is the process by which plants convert light energy into chemical energy."
     question_types = ["multiple_choice", "short_answer", "fill_blank"]
 
@@ -37,13 +45,11 @@ def test_generate_from_text_sets_question_types_in_state():
 
     assert quiz.current_quiz_state["question_types"] == question_types
 
-def test_shuffle_does_not_change_question_types():
+def test_shuffle_does_not_change_question_types(quiz):
     """
     After generating a quiz with certain question types,
     shuffling should not change which question types are recorded.
     """
-    quiz = Quiz()
-
     input_text = "The mitochondria is the powerhouse of the cell."
     question_types = ["fill_blank"] 
 
@@ -59,15 +65,12 @@ def test_shuffle_does_not_change_question_types():
 
     assert quiz.current_quiz_state["question_types"] == before
 
-def test_generate_from_text_overwrites_previous_question_types():
+def test_generate_from_text_overwrites_previous_question_types(quiz):
     """
     When generate_from_text is called multiple times with different
     question_types, the quiz should reflect the latest choice.
     """
-    quiz = Quiz()
-
-    
-    quiz.generate("text", 
+    quiz.generate("text",
         input="First topic text",
         num_questions=2,
         question_types=["multiple_choice"],
@@ -1,12 +1,30 @@
 import pytest
-import json
+import orjson
+import io
 import os
-from unittest.mock import patch, mock_open, MagicMock
-import tempfile
+from unittest.mock import DEFAULT, patch
+import random
+from types import MappingProxyType
 
+from terminal.question_pools import (
+    generate_quiz_from_pools,
+    run_question_pools,
+    save_template,
+)
 
-# Sample test data
-SAMPLE_POOLS = {
+
+def _seed(seed):
+    """Reseed the global RNG from a throwaway local random.Random.
+
+    generate_quiz_from_pools draws from the module-global RNG; until it
+    grows an rng= parameter, injecting a fresh local instance's state is
+    the closest we can get to per-test RNG isolation.
+    """
+    random.setstate(random.Random(seed).getstate())
+
+
+# Sample test data, frozen so no test can mutate the shared objects
+SAMPLE_POOLS = MappingProxyType({
     "Topic 1: NLP": [
         "What does NLP stand for?",
         "What is tokenization?",
@@ -22,189 +40,143 @@ SAMPLE_POOLS = {
         "Define activation function.",
         "What is backpropagation?"
     ]
-}
+})
 
-SAMPLE_SETTINGS = {
+SAMPLE_SETTINGS = MappingProxyType({
     "Topic 1: NLP": 1,
     "Topic 2: Machine Learning": 1,
     "Topic 3: Deep Learning": 1
-}
+})
+
+
+@pytest.fixture(scope="session")
+def sample_pools():
+    """The frozen sample pools, handed out once per session."""
+    return SAMPLE_POOLS
+
+
+@pytest.fixture(scope="session")
+def sample_settings():
+    """The frozen sample settings, handed out once per session.
+
+    json.dump rejects mappingproxy objects, so tests that feed this to
+    save_template wrap it in dict() first.
+    """
+    return SAMPLE_SETTINGS
+
+# (pools, settings, expected quiz length) cases folded into one
+# parametrized test; each used to be its own near-identical method
+QUIZ_LENGTH_CASES = [
+    (SAMPLE_POOLS, SAMPLE_SETTINGS, 3),
+    (SAMPLE_POOLS, {
+        "Topic 1: NLP": 2,
+        "Topic 2: Machine Learning": 2,
+        "Topic 3: Deep Learning": 2
+    }, 6),
+    (SAMPLE_POOLS, {
+        "Topic 1: NLP": 3,
+        "Topic 2: Machine Learning": 3,
+        "Topic 3: Deep Learning": 3
+    }, 9),
+    (SAMPLE_POOLS, {
+        "Topic 1: NLP": 0,
+        "Topic 2: Machine Learning": 1,
+        "Topic 3: Deep Learning": 1
+    }, 2),
+    (SAMPLE_POOLS, {}, 0),
+    # Topics missing from settings should default to 0
+    (SAMPLE_POOLS, {"Topic 1: NLP": 1}, 1),
+    ({"Topic 1: NLP": ["Q1", "Q2", "Q3"]}, {"Topic 1: NLP": 2}, 2),
+    ({"Empty Topic": [], "Topic 1: NLP": ["Q1", "Q2"]},
+     {"Empty Topic": 0, "Topic 1: NLP": 1}, 1),
+]
+
+QUIZ_LENGTH_IDS = [
+    "basic",
+    "multiple-per-topic",
+    "all-questions",
+    "zero-from-topic",
+    "empty-settings",
+    "missing-topic",
+    "single-topic",
+    "empty-pool",
+]
 
 
 class TestGenerateQuizFromPools:
     """Test suite for generate_quiz_from_pools function"""
-    
-    def test_basic_quiz_generation(self):
-        """Test basic quiz generation with standard settings"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
+
+    @pytest.mark.parametrize("pools,settings,expected", QUIZ_LENGTH_CASES,
+                             ids=QUIZ_LENGTH_IDS)
+    def test_quiz_length(self, pools, settings, expected):
+        """Test quiz length across pool/settings combinations"""
         # Set random seed for reproducibility
-        import random
-        random.seed(42)
-        
-        result = generate_quiz_from_pools(SAMPLE_POOLS, SAMPLE_SETTINGS)
-        
+        _seed(42)
+
+        result = generate_quiz_from_pools(pools, settings)
+
         assert isinstance(result, list)
-        assert len(result) == 3  # 1 question from each topic
-        
+        assert len(result) == expected
+
         # Each question should be a string
         for question in result:
             assert isinstance(question, str)
-    
-    def test_multiple_questions_per_topic(self):
-        """Test selecting multiple questions from each pool"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        import random
-        random.seed(42)
-        
-        settings = {
-            "Topic 1: NLP": 2,
-            "Topic 2: Machine Learning": 2,
-            "Topic 3: Deep Learning": 2
-        }
-        
-        result = generate_quiz_from_pools(SAMPLE_POOLS, settings)
-        
-        assert len(result) == 6  # 2 questions from each of 3 topics
-    
-    def test_all_questions_from_pool(self):
-        """Test selecting all questions from a pool"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        import random
-        random.seed(42)
-        
-        settings = {
-            "Topic 1: NLP": 3,  # All 3 questions
-            "Topic 2: Machine Learning": 3,
-            "Topic 3: Deep Learning": 3
-        }
-        
-        result = generate_quiz_from_pools(SAMPLE_POOLS, settings)
-        
-        assert len(result) == 9  # All questions from all pools
-    
-    def test_zero_questions_from_topic(self):
-        """Test with zero questions requested from a topic"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        settings = {
-            "Topic 1: NLP": 0,
-            "Topic 2: Machine Learning": 1,
-            "Topic 3: Deep Learning": 1
-        }
-        
-        result = generate_quiz_from_pools(SAMPLE_POOLS, settings)
-        
-        assert len(result) == 2  # Only 2 topics have questions
-    
-    def test_empty_settings(self):
-        """Test with empty settings dictionary"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        settings = {}
-        
-        result = generate_quiz_from_pools(SAMPLE_POOLS, settings)
-        
-        # Should return empty list since no topics are requested
-        assert len(result) == 0
-    
-    def test_missing_topic_in_settings(self):
-        """Test when a topic exists in pools but not in settings"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        settings = {
-            "Topic 1: NLP": 1,
-            # Topic 2 and 3 are missing - should default to 0
-        }
-        
-        result = generate_quiz_from_pools(SAMPLE_POOLS, settings)
-        
-        assert len(result) == 1  # Only 1 topic has settings
-    
-    def test_single_topic_pool(self):
-        """Test with only one topic"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        pools = {
-            "Topic 1: NLP": ["Q1", "Q2", "Q3"]
-        }
-        settings = {
-            "Topic 1: NLP": 2
-        }
-        
-        result = generate_quiz_from_pools(pools, settings)
-        
-        assert len(result) == 2
-    
-    def test_randomness(self):
+
+    def test_randomness(self, sample_pools, sample_settings):
         """Test that questions are randomly selected"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        import random
-        
-        # Generate multiple quizzes and check they're different
-        results = []
+        # Generate quizzes under different seeds and stop as soon as two
+        # distinct ones show up -- usually after the second draw
+        unique_quizzes = set()
         for seed in range(5):
-            random.seed(seed)
-            quiz = generate_quiz_from_pools(SAMPLE_POOLS, SAMPLE_SETTINGS)
-            results.append(quiz)
-        
+            _seed(seed)
+            quiz = generate_quiz_from_pools(sample_pools, sample_settings)
+            unique_quizzes.add(tuple(quiz))
+            if len(unique_quizzes) > 1:
+                break
+
         # At least some quizzes should be different
-        unique_quizzes = [tuple(r) for r in results]
-        assert len(set(unique_quizzes)) > 1
+        assert len(unique_quizzes) > 1
     
-    def test_questions_come_from_correct_pools(self):
+    def test_questions_come_from_correct_pools(self, sample_pools, sample_settings):
         """Test that selected questions actually exist in their pools"""
-        from terminal.question_pools import generate_quiz_from_pools
+        _seed(42)
         
-        import random
-        random.seed(42)
-        
-        result = generate_quiz_from_pools(SAMPLE_POOLS, SAMPLE_SETTINGS)
+        result = generate_quiz_from_pools(sample_pools, sample_settings)
         
         # Flatten all questions from all pools
         all_questions = []
-        for questions in SAMPLE_POOLS.values():
+        for questions in sample_pools.values():
             all_questions.extend(questions)
         
         # Each result question should be in the original pools
         for question in result:
             assert question in all_questions
     
-    def test_no_duplicate_questions(self):
+    def test_no_duplicate_questions(self, sample_pools):
         """Test that no duplicate questions are selected from same pool"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
-        import random
-        random.seed(42)
+        _seed(42)
         
         settings = {
             "Topic 1: NLP": 3,  # All questions from this pool
         }
         
-        result = generate_quiz_from_pools(SAMPLE_POOLS, settings)
+        result = generate_quiz_from_pools(sample_pools, settings)
         
         # Should have no duplicates
         assert len(result) == len(set(result))
     
-    def test_invalid_amount_exceeds_pool_size(self):
+    def test_invalid_amount_exceeds_pool_size(self, sample_pools):
         """Test behavior when requesting more questions than available"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
         settings = {
             "Topic 1: NLP": 10,  # More than 3 available
         }
         
         # Should raise ValueError (random.sample behavior)
         with pytest.raises(ValueError):
-            generate_quiz_from_pools(SAMPLE_POOLS, settings)
+            generate_quiz_from_pools(sample_pools, settings)
     
     def test_empty_pool(self):
         """Test with an empty question pool"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
         pools = {
             "Empty Topic": [],
             "Topic 1: NLP": ["Q1", "Q2"]
@@ -222,154 +194,134 @@ class TestGenerateQuizFromPools:
 class TestSaveTemplate:
     """Test suite for save_template function"""
     
-    def test_save_template_default_filename(self):
+    def test_save_template_default_filename(self, tmp_path, monkeypatch, sample_settings):
         """Test saving template with default filename"""
-        from terminal.question_pools import save_template
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "quiz_template.json")
-            
-            # Mock to capture print output
-            with patch('builtins.print') as mock_print:
-                with patch('builtins.open', mock_open()) as mock_file:
-                    # Override the open to write to temp directory
-                    save_template(SAMPLE_SETTINGS, filename=filepath)
-                    
-                    # Verify file was opened for writing
-                    mock_file.assert_called_once()
-    
-    def test_save_template_custom_filename(self):
+        filepath = str(tmp_path / "quiz_template.json")
+
+        # Capture open calls instead of writing anywhere
+        open_calls = []
+        monkeypatch.setattr('builtins.open',
+                            lambda *a, **k: (open_calls.append(a), io.StringIO())[1])
+        monkeypatch.setattr('builtins.print', lambda *a, **k: None)
+
+        save_template(dict(sample_settings), filename=filepath)
+
+        # Verify file was opened for writing
+        assert len(open_calls) == 1
+
+    def test_save_template_custom_filename(self, monkeypatch, sample_settings):
         """Test saving template with custom filename"""
-        from terminal.question_pools import save_template
-        
         custom_filename = "custom_template.json"
-        
-        with patch('builtins.open', mock_open()) as mock_file:
-            with patch('builtins.print'):
-                save_template(SAMPLE_SETTINGS, filename=custom_filename)
-                
-                # Verify custom filename was used
-                mock_file.assert_called_with(custom_filename, "w")
+
+        open_calls = []
+        monkeypatch.setattr('builtins.open',
+                            lambda *a, **k: (open_calls.append(a), io.StringIO())[1])
+        monkeypatch.setattr('builtins.print', lambda *a, **k: None)
+
+        save_template(dict(sample_settings), filename=custom_filename)
+
+        # Verify custom filename was used
+        assert open_calls[0] == (custom_filename, "w")
     
-    def test_save_template_content(self):
+    @pytest.fixture
+    def capture_buffer(self, monkeypatch):
+        """Redirect open() to an in-memory buffer -- no disk round-trip."""
+        buf = io.StringIO()
+        buf.close = lambda: None  # keep contents readable after the with-block
+        monkeypatch.setattr('builtins.open', lambda *a, **k: buf)
+        monkeypatch.setattr('builtins.print', lambda *a, **k: None)
+        return buf
+
+    def test_save_template_content(self, capture_buffer, sample_settings):
         """Test that template content is correctly formatted JSON"""
-        from terminal.question_pools import save_template
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            with patch('builtins.print'):
-                save_template(SAMPLE_SETTINGS, filename=tmp_path)
-            
-            # Read back and verify JSON structure
-            with open(tmp_path, 'r') as f:
-                loaded = json.load(f)
-            
-            assert loaded == SAMPLE_SETTINGS
-            assert "Topic 1: NLP" in loaded
-            assert loaded["Topic 1: NLP"] == 1
-        finally:
-            os.unlink(tmp_path)
-    
-    def test_save_template_indent(self):
+        save_template(dict(sample_settings), filename="template.json")
+
+        # Re-parse the buffer and verify JSON structure
+        loaded = orjson.loads(capture_buffer.getvalue())
+
+        assert loaded == sample_settings
+        assert "Topic 1: NLP" in loaded
+        assert loaded["Topic 1: NLP"] == 1
+
+    def test_save_template_indent(self, capture_buffer, sample_settings):
         """Test that saved JSON is properly indented"""
-        from terminal.question_pools import save_template
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            with patch('builtins.print'):
-                save_template(SAMPLE_SETTINGS, filename=tmp_path)
-            
-            # Read as text to check formatting
-            with open(tmp_path, 'r') as f:
-                content = f.read()
-            
-            # Should contain newlines (indented JSON)
-            assert '\n' in content
-            # Should contain proper indentation
-            assert '    ' in content
-        finally:
-            os.unlink(tmp_path)
-    
-    def test_save_template_empty_settings(self):
+        save_template(dict(sample_settings), filename="template.json")
+
+        content = capture_buffer.getvalue()
+
+        # Should contain newlines (indented JSON)
+        assert '\n' in content
+        # Should contain proper indentation
+        assert '    ' in content
+
+    def test_save_template_empty_settings(self, capture_buffer):
         """Test saving empty settings"""
-        from terminal.question_pools import save_template
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            with patch('builtins.print'):
-                save_template({}, filename=tmp_path)
-            
-            with open(tmp_path, 'r') as f:
-                loaded = json.load(f)
-            
-            assert loaded == {}
-        finally:
-            os.unlink(tmp_path)
+        save_template({}, filename="template.json")
+
+        assert orjson.loads(capture_buffer.getvalue()) == {}
     
-    def test_save_template_print_message(self):
+    def test_save_template_print_message(self, monkeypatch, sample_settings):
         """Test that save_template prints confirmation message"""
-        from terminal.question_pools import save_template
-        
         filename = "test_template.json"
-        
-        with patch('builtins.open', mock_open()):
-            with patch('builtins.print') as mock_print:
-                save_template(SAMPLE_SETTINGS, filename=filename)
-                
-                # Verify print was called with correct message
-                mock_print.assert_called_once_with(f"Template saved as {filename}")
+
+        printed = []
+        monkeypatch.setattr('builtins.open', lambda *a, **k: io.StringIO())
+        monkeypatch.setattr('builtins.print',
+                            lambda *a, **k: printed.append(' '.join(map(str, a))))
+
+        save_template(dict(sample_settings), filename=filename)
+
+        # Verify print was called with correct message
+        assert printed == [f"Template saved as {filename}"]
 
 
 class TestRunQuestionPools:
     """Test suite for run_question_pools function"""
     
     @patch('builtins.print')
-    @patch('terminal.question_pools.save_template')
-    @patch('terminal.question_pools.generate_quiz_from_pools')
-    def test_run_question_pools_execution(self, mock_generate, mock_save, mock_print):
+    def test_run_question_pools_execution(self, mock_print):
         """Test that run_question_pools executes all steps"""
-        from terminal.question_pools import run_question_pools
-        
-        # Mock the quiz generation to return a predictable result
-        mock_generate.return_value = ["Q1", "Q2", "Q3"]
-        
-        run_question_pools()
-        
-        # Verify generate_quiz_from_pools was called
-        mock_generate.assert_called_once()
-        
-        # Verify save_template was called
-        mock_save.assert_called_once()
-        
+        # patch.multiple must be a context manager here: as a decorator it
+        # injects its mocks as keyword arguments, which pytest mistakes for
+        # fixtures
+        with patch.multiple('terminal.question_pools',
+                            generate_quiz_from_pools=DEFAULT,
+                            save_template=DEFAULT) as mocks:
+            # Mock the quiz generation to return a predictable result
+            mocks['generate_quiz_from_pools'].return_value = ["Q1", "Q2", "Q3"]
+
+            run_question_pools()
+
+            # Verify generate_quiz_from_pools was called
+            mocks['generate_quiz_from_pools'].assert_called_once()
+
+            # Verify save_template was called
+            mocks['save_template'].assert_called_once()
+
         # Verify print statements were made
         assert mock_print.call_count > 0
-    
-    @patch('builtins.print')
-    @patch('terminal.question_pools.save_template')
-    @patch('terminal.question_pools.generate_quiz_from_pools')
-    def test_run_question_pools_output_format(self, mock_generate, mock_save, mock_print):
+
+    def test_run_question_pools_output_format(self, monkeypatch):
         """Test that output is properly formatted"""
-        from terminal.question_pools import run_question_pools
-        
         mock_quiz = ["Q1", "Q2", "Q3"]
-        mock_generate.return_value = mock_quiz
-        
-        run_question_pools()
-        
-        # Check that questions are printed with numbering
-        print_calls = [str(call) for call in mock_print.call_args_list]
-        
+
+        # Capture prints as plain strings instead of repr-ing _Call objects
+        printed = []
+        monkeypatch.setattr('builtins.print',
+                            lambda *a, **k: printed.append(' '.join(map(str, a))))
+
+        with patch.multiple('terminal.question_pools',
+                            generate_quiz_from_pools=DEFAULT,
+                            save_template=DEFAULT) as mocks:
+            mocks['generate_quiz_from_pools'].return_value = mock_quiz
+
+            run_question_pools()
+
         # Should contain header message
-        assert any("Generating quiz" in str(call) for call in print_calls)
-        
+        assert any("Generating quiz" in line for line in printed)
+
         # Should contain question numbering
-        assert any("1." in str(call) for call in print_calls)
+        assert any("1." in line for line in printed)
 
 
 class TestEdgeCases:
@@ -377,8 +329,6 @@ class TestEdgeCases:
     
     def test_unicode_questions(self):
         """Test with unicode characters in questions"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
         pools = {
             "Unicode Topic": [
                 "¿Qué es NLP?",
@@ -388,8 +338,7 @@ class TestEdgeCases:
         }
         settings = {"Unicode Topic": 2}
         
-        import random
-        random.seed(42)
+        _seed(42)
         
         result = generate_quiz_from_pools(pools, settings)
         
@@ -399,16 +348,13 @@ class TestEdgeCases:
     
     def test_very_long_questions(self):
         """Test with very long question strings"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
         long_question = "This is a very long question " * 50
         pools = {
             "Long Topic": [long_question, "Short question"]
         }
         settings = {"Long Topic": 1}
         
-        import random
-        random.seed(42)
+        _seed(42)
         
         result = generate_quiz_from_pools(pools, settings)
         
@@ -417,8 +363,6 @@ class TestEdgeCases:
     
     def test_special_characters_in_topic_names(self):
         """Test with special characters in topic names"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
         pools = {
             "Topic #1: AI/ML": ["Q1", "Q2"],
             "Topic @2: NLP & DL": ["Q3", "Q4"]
@@ -428,8 +372,7 @@ class TestEdgeCases:
             "Topic @2: NLP & DL": 1
         }
         
-        import random
-        random.seed(42)
+        _seed(42)
         
         result = generate_quiz_from_pools(pools, settings)
         
@@ -437,15 +380,12 @@ class TestEdgeCases:
     
     def test_numeric_question_content(self):
         """Test questions containing only numbers"""
-        from terminal.question_pools import generate_quiz_from_pools
-        
         pools = {
             "Math": ["2 + 2 = ?", "10 * 5 = ?", "100 / 4 = ?"]
         }
         settings = {"Math": 2}
         
-        import random
-        random.seed(42)
+        _seed(42)
         
         result = generate_quiz_from_pools(pools, settings)
         
@@ -455,65 +395,34 @@ class TestEdgeCases:
 class TestIntegration:
     """Integration tests for the complete workflow"""
     
-    def test_full_workflow(self):
-        """Test complete workflow from generation to saving"""
-        from terminal.question_pools import generate_quiz_from_pools, save_template
-        
-        import random
-        random.seed(42)
-        
+    def test_save_and_reload_roundtrip(self, tmp_path, sample_pools, sample_settings):
+        """Test the full generate -> save -> load -> regenerate workflow"""
+        filepath = tmp_path / "template.json"
+
         # Generate quiz
-        quiz = generate_quiz_from_pools(SAMPLE_POOLS, SAMPLE_SETTINGS)
-        
-        assert len(quiz) > 0
-        
+        _seed(42)
+        quiz1 = generate_quiz_from_pools(sample_pools, sample_settings)
+
+        assert len(quiz1) > 0
+
         # Save template
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            with patch('builtins.print'):
-                save_template(SAMPLE_SETTINGS, filename=tmp_path)
-            
-            # Verify file exists and is valid JSON
-            assert os.path.exists(tmp_path)
-            
-            with open(tmp_path, 'r') as f:
-                loaded = json.load(f)
-            
-            assert loaded == SAMPLE_SETTINGS
-        finally:
-            os.unlink(tmp_path)
-    
-    def test_load_and_regenerate_quiz(self):
-        """Test saving template and using it to regenerate quiz"""
-        from terminal.question_pools import generate_quiz_from_pools, save_template
-        
-        import random
-        
-        # Generate and save
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            random.seed(42)
-            quiz1 = generate_quiz_from_pools(SAMPLE_POOLS, SAMPLE_SETTINGS)
-            
-            with patch('builtins.print'):
-                save_template(SAMPLE_SETTINGS, filename=tmp_path)
-            
-            # Load template
-            with open(tmp_path, 'r') as f:
-                loaded_settings = json.load(f)
-            
-            # Regenerate with loaded settings
-            random.seed(42)
-            quiz2 = generate_quiz_from_pools(SAMPLE_POOLS, loaded_settings)
-            
-            # Should produce same quiz with same seed
-            assert quiz1 == quiz2
-        finally:
-            os.unlink(tmp_path)
+        with patch('builtins.print'):
+            save_template(dict(sample_settings), filename=str(filepath))
+
+        # Verify file exists and round-trips as JSON
+        assert os.path.exists(filepath)
+
+        with open(filepath, 'rb') as f:
+            loaded_settings = orjson.loads(f.read())
+
+        assert loaded_settings == sample_settings
+
+        # Regenerate with loaded settings
+        _seed(42)
+        quiz2 = generate_quiz_from_pools(sample_pools, loaded_settings)
+
+        # Should produce same quiz with same seed
+        assert quiz1 == quiz2
 
 
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_quiz_caches():
+    """Reset any lru_cache state in phases.quizzes after each test.
+
+    Module-level caches survive across tests, which can hide real render
+    cost behind the first test and skew profiling. The module is looked up
+    through sys.modules so files that never import it (or that stub heavy
+    dependencies before importing) are unaffected.
+    """
+    yield
+    module = sys.modules.get('phases.quizzes')
+    if module is None:
+        return
+    for obj in vars(module).values():
+        if hasattr(obj, 'cache_clear'):
+            obj.cache_clear()
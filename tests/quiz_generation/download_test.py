@@ -3,16 +3,29 @@ from unittest.mock import patch, mock_open, MagicMock
 import csv
 from io import StringIO
 
-from phases.quizzes import Quiz 
+from phases.quizzes import Quiz
+
+
+@pytest.fixture(scope="module")
+def quiz_instance():
+    return Quiz()
+
 
 class TestQuizFileFormats:
-    @pytest.fixture
-    def quiz_instance(self):
-        return Quiz()
-    
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _reset_quiz(self, quiz_instance):
+        """Clear state left on the shared instance by the previous test."""
+        quiz_instance.current_quiz_state = {
+            "questions": [],
+            "num_questions": 0,
+            "question_types": []
+        }
+        quiz_instance.markdown_result = ""
+
+    @pytest.fixture(scope="module")
     def sample_questions(self):
-        return [
+        """Shared read-only questions; built once for the whole module."""
+        return (
             {
                 'question': 'Python is a high-level _____ language.',
                 'answer': 'programming',
@@ -29,12 +42,13 @@ class TestQuizFileFormats:
                 'answer': 'OOP is a programming paradigm',
                 'type': 'topic'
             }
-        ]
-    
+        )
+
     @pytest.fixture
     def setup_quiz_with_questions(self, quiz_instance, sample_questions):
         """Setup quiz instance with sample questions"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions
+        # Shallow copy so the quiz state stays mutable per test
+        quiz_instance.current_quiz_state['questions'] = list(sample_questions)
         quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
         quiz_instance.markdown_result = "# Sample Quiz\n\n**Q1.** Test question?"
         return quiz_instance
@@ -49,9 +63,10 @@ class TestQuizFileFormats:
             assert filename == "generated_quiz.md"
             mock_file.assert_called_once_with("generated_quiz.md", "w", encoding='utf-8')
             
-            # Verify markdown content was written
+            # Verify markdown content was written; joining tolerates a
+            # streaming implementation that writes in several chunks
             handle = mock_file()
-            written_content = handle.write.call_args[0][0]
+            written_content = ''.join(c.args[0] for c in handle.write.call_args_list)
             assert "# Sample Quiz" in written_content
     
     def test_download_csv_format(self, setup_quiz_with_questions):
@@ -64,9 +79,9 @@ class TestQuizFileFormats:
             assert filename == "generated_quiz.csv"
             mock_file.assert_called_once()
             
-            # Verify CSV content
+            # Verify CSV content across all write calls
             handle = mock_file()
-            written_content = handle.write.call_args[0][0]
+            written_content = ''.join(c.args[0] for c in handle.write.call_args_list)
             
             # Parse CSV to verify structure
             csv_reader = csv.reader(StringIO(written_content))
@@ -86,9 +101,9 @@ class TestQuizFileFormats:
             assert filename == "generated_quiz.txt"
             mock_file.assert_called_once_with("generated_quiz.txt", "w", encoding='utf-8')
             
-            # Verify text content
+            # Verify text content across all write calls
             handle = mock_file()
-            written_content = handle.write.call_args[0][0]
+            written_content = ''.join(c.args[0] for c in handle.write.call_args_list)
             
             assert "Generated Quiz" in written_content
             assert "Q1." in written_content
@@ -1,13 +1,20 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from functools import lru_cache
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 import sys
 
 
-# Mock transformers to avoid loading actual models during testing
-sys.modules['transformers'] = MagicMock()
-sys.modules['sklearn'] = MagicMock()
-sys.modules['sklearn.feature_extraction'] = MagicMock()
-sys.modules['sklearn.feature_extraction.text'] = MagicMock()
+# Mock transformers to avoid loading actual models during testing.
+# setdefault keeps the injection idempotent: if this file is imported twice
+# the existing mocks stay in place instead of being swapped behind modules
+# that already imported them.
+for _name in ('transformers', 'sklearn', 'sklearn.feature_extraction',
+              'sklearn.feature_extraction.text'):
+    sys.modules.setdefault(_name, MagicMock())
+
+# Import once, after the mock injection above; every test used to repeat
+# this inside its body
+from phases.quiz_generator import QuizAI
 
 
 # Sample quiz text for testing
@@ -51,142 +58,189 @@ d) They don't need GPUs
 """
 
 
-class TestExtractFirstQuestion:
-    """Test suite for extract_first_question method"""
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_extract_single_question_basic(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test extracting a single question from quiz text"""
-        # We need to import after mocking
-        from phases.quiz_generator import QuizAI
-        
-        quiz_ai = QuizAI()
-        result = quiz_ai.extract_first_question(SAMPLE_QUIZ_TEXT)
-        
-        # Should contain question 1
-        assert "1. What does NLP stand for?" in result
-        assert "a) Natural Language Processing" in result
-        assert "d) Neural Language Path" in result
-        
-        # Should NOT contain question 2
-        assert "2. What is machine learning?" not in result
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_extract_stops_at_option_d(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test that extraction stops after option d"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_ai = QuizAI()
-        result = quiz_ai.extract_first_question(SAMPLE_QUIZ_TEXT)
-        
-        lines = result.strip().split('\n')
-        last_line = lines[-1].strip().lower()
-        
-        # Last line should be option d
-        assert last_line.startswith('d)')
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_extract_with_question_keyword(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test extraction when line starts with 'Question' keyword"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_text = """
+def make_generator(text):
+    """Minimal stand-in for the HF text2text pipeline.
+
+    Records each prompt in ``gen.calls`` and returns one canned generation;
+    much cheaper than a MagicMock for the tests that only read the prompt
+    back or count calls.
+    """
+    def gen(prompt, *args, **kwargs):
+        gen.calls.append(prompt)
+        return [{"generated_text": text}]
+    gen.calls = []
+    return gen
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _mock_transformers():
+    """Patch the transformers entry points once for the whole module.
+
+    Replaces the three stacked @patch decorators that every test used to
+    carry (~66 patch setup/teardown cycles for the file).
+    """
+    with patch.multiple('transformers',
+                        AutoTokenizer=DEFAULT,
+                        AutoModelForSeq2SeqLM=DEFAULT,
+                        pipeline=DEFAULT):
+        yield
+
+
+@pytest.fixture(scope="module")
+def quiz_ai(_mock_transformers):
+    """One QuizAI for the whole module; construction is the expensive part.
+
+    Safe to share because every test rebinds ``quiz_ai.generator`` to its own
+    mock before calling into the instance.
+    """
+    return QuizAI()
+
+
+@pytest.fixture(scope="module")
+def extract(quiz_ai):
+    """Cached front end to quiz_ai.extract_first_question.
+
+    Inputs in this file are constant strings, so each unique text is
+    line-scanned once per module and every later call is a cache hit.
+    """
+    @lru_cache(maxsize=None)
+    def _extract(text):
+        return quiz_ai.extract_first_question(text)
+    return _extract
+
+
+@pytest.fixture(scope="module")
+def gen_factory():
+    """make_generator stubs cached per canned return string.
+
+    One generator is built per unique text for the whole module; its
+    recorded calls are cleared on hand-out so call-count assertions stay
+    scoped to the requesting test.
+    """
+    cache = {}
+
+    def make(text):
+        if text not in cache:
+            cache[text] = make_generator(text)
+        gen = cache[text]
+        gen.calls.clear()
+        return gen
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def prompt_for(quiz_ai):
+    """The prompt generate_explanations sends for a given quiz text.
+
+    Computed once per unique text with a throwaway recording generator;
+    tests that only inspect the prompt share the cached result instead of
+    re-running the generation path.
+    """
+    cache = {}
+
+    def _prompt(text):
+        if text not in cache:
+            gen = make_generator("")
+            quiz_ai.generator = gen
+            quiz_ai.generate_explanations(text)
+            cache[text] = gen.calls[-1]
+        return cache[text]
+
+    return _prompt
+
+
+QUESTION_KEYWORD_TEXT = """
 Question: What is AI?
 a) Artificial Intelligence
 b) Automated Integration
 c) Applied Information
 d) None of the above
 """
-        
-        quiz_ai = QuizAI()
-        result = quiz_ai.extract_first_question(quiz_text)
-        
-        assert "Question: What is AI?" in result
-        assert "a) Artificial Intelligence" in result
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_extract_empty_text(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test extraction with empty quiz text"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_ai = QuizAI()
-        result = quiz_ai.extract_first_question("")
-        
-        assert result == ""
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_extract_whitespace_only(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test extraction with whitespace only"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_ai = QuizAI()
-        result = quiz_ai.extract_first_question("   \n\n   ")
-        
-        # Should return empty or whitespace
-        assert result.strip() == ""
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_extract_preserves_formatting(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test that indentation and spacing are preserved"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_ai = QuizAI()
-        result = quiz_ai.extract_first_question(SAMPLE_MULTILINE_QUESTION)
-        
-        # Should preserve the multiline question format
-        assert "deep learning networks?" in result
-        lines = result.split('\n')
-        assert len(lines) > 1
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_extract_case_insensitive(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test that extraction works with different cases for option d"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_text = """
+
+UPPERCASE_OPTION_D_TEXT = """
 1. Test question?
 a) Option A
 b) Option B
 c) Option C
 D) Option D
 """
-        
-        quiz_ai = QuizAI()
-        result = quiz_ai.extract_first_question(quiz_text)
-        
-        # Should stop at D) even though it's uppercase
-        assert "D) Option D" in result
+
+# One row per former test method: (text, must_contain, must_not_contain).
+# Rows with no expected fragments assert that extraction comes back empty.
+EXTRACT_CASES = [
+    (SAMPLE_QUIZ_TEXT,
+     ["1. What does NLP stand for?", "a) Natural Language Processing",
+      "d) Neural Language Path"],
+     ["2. What is machine learning?"]),
+    (QUESTION_KEYWORD_TEXT,
+     ["Question: What is AI?", "a) Artificial Intelligence"],
+     []),
+    ("", [], []),
+    ("   \n\n   ", [], []),
+    (UPPERCASE_OPTION_D_TEXT, ["D) Option D"], []),
+]
+EXTRACT_CASE_IDS = [
+    "first-question-only",
+    "question-keyword",
+    "empty-text",
+    "whitespace-only",
+    "uppercase-option-d",
+]
+
+
+class TestExtractFirstQuestion:
+    """Test suite for extract_first_question method"""
+
+    @pytest.mark.parametrize("text,must_contain,must_not_contain",
+                             EXTRACT_CASES, ids=EXTRACT_CASE_IDS)
+    def test_extract_first_question(self, extract, text, must_contain, must_not_contain):
+        """Test extraction across the containment-style cases"""
+
+        result = extract(text)
+
+        for fragment in must_contain:
+            assert fragment in result
+        for fragment in must_not_contain:
+            assert fragment not in result
+
+        # Degenerate inputs should extract to (effectively) nothing
+        if not must_contain:
+            assert result.strip() == ""
+
+    def test_extract_stops_at_option_d(self, extract):
+        """Test that extraction stops after option d"""
+
+        result = extract(SAMPLE_QUIZ_TEXT)
+
+        # splitlines does the strip-and-split in one C-level pass; drop any
+        # blank tail lines so the last entry is the final option
+        lines = [line for line in result.splitlines() if line.strip()]
+        last_line = lines[-1].strip().lower()
+
+        # Last line should be option d
+        assert last_line.startswith('d)')
+
+    def test_extract_preserves_formatting(self, extract):
+        """Test that indentation and spacing are preserved"""
+
+        result = extract(SAMPLE_MULTILINE_QUESTION)
+
+        # Should preserve the multiline question format
+        assert "deep learning networks?" in result
+        lines = result.split('\n')
+        assert len(lines) > 1
 
 
 class TestGenerateExplanations:
     """Test suite for generate_explanations method"""
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generate_explanation_basic(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_generate_explanation_basic(self, gen_factory, quiz_ai):
         """Test basic explanation generation"""
-        from phases.quiz_generator import QuizAI
         
         # Mock the generator response
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "NLP stands for Natural Language Processing, which is a field of AI."}]
+        mock_generator = gen_factory("NLP stands for Natural Language Processing, which is a field of AI.")
         
-        quiz_ai = QuizAI()
         quiz_ai.generator = mock_generator
         
         result = quiz_ai.generate_explanations(SAMPLE_QUIZ_TEXT)
@@ -196,102 +250,72 @@ class TestGenerateExplanations:
         assert "Natural Language Processing" in result
         
         # Verify generator was called
-        mock_generator.assert_called_once()
+        assert len(mock_generator.calls) == 1
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generate_explanation_calls_extract(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_generate_explanation_calls_extract(self, gen_factory, quiz_ai, mocker):
         """Test that generate_explanations calls extract_first_question"""
-        from phases.quiz_generator import QuizAI
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Test explanation"}]
-        
-        quiz_ai = QuizAI()
+
+        mock_generator = gen_factory("Test explanation")
+
         quiz_ai.generator = mock_generator
-        
-        # Spy on extract_first_question
-        original_extract = quiz_ai.extract_first_question
-        quiz_ai.extract_first_question = Mock(side_effect=original_extract)
-        
+
+        # mocker.spy keeps the real implementation and restores the shared
+        # instance when the test ends
+        spy = mocker.spy(quiz_ai, 'extract_first_question')
+
         quiz_ai.generate_explanations(SAMPLE_QUIZ_TEXT)
-        
+
         # Verify extract was called with the quiz text
-        quiz_ai.extract_first_question.assert_called_once_with(SAMPLE_QUIZ_TEXT)
+        spy.assert_called_once_with(SAMPLE_QUIZ_TEXT)
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generate_explanation_prompt_format(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_generate_explanation_prompt_format(self, gen_factory, quiz_ai):
         """Test that the prompt is properly formatted"""
-        from phases.quiz_generator import QuizAI
         
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Explanation text"}]
+        mock_generator = gen_factory("Explanation text")
         
-        quiz_ai = QuizAI()
         quiz_ai.generator = mock_generator
         
         quiz_ai.generate_explanations(SAMPLE_SINGLE_QUESTION)
         
-        # Get the call arguments
-        call_args = mock_generator.call_args[0][0]
-        
-        # Verify prompt structure
-        assert "Explain the correct answer" in call_args
-        assert "What is Python?" in call_args
-        assert "Provide a short and clear explanation" in call_args
+        # Bind the prompt once, then check every fragment in one pass
+        prompt = mock_generator.calls[-1]
+        assert all(fragment in prompt for fragment in (
+            "Explain the correct answer",
+            "What is Python?",
+            "Provide a short and clear explanation",
+        ))
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generate_explanation_empty_quiz(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_generate_explanation_empty_quiz(self, gen_factory, quiz_ai):
         """Test explanation generation with empty quiz text"""
-        from phases.quiz_generator import QuizAI
         
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "No explanation available"}]
+        mock_generator = gen_factory("No explanation available")
         
-        quiz_ai = QuizAI()
         quiz_ai.generator = mock_generator
         
         result = quiz_ai.generate_explanations("")
         
         # Should still call generator (with empty extracted question)
         assert isinstance(result, str)
-        mock_generator.assert_called_once()
+        assert len(mock_generator.calls) == 1
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generate_explanation_with_asterisk(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_generate_explanation_with_asterisk(self, gen_factory, quiz_ai):
         """Test explanation generation when correct answer is marked with asterisk"""
-        from phases.quiz_generator import QuizAI
         
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "AI stands for Artificial Intelligence."}]
+        mock_generator = gen_factory("AI stands for Artificial Intelligence.")
         
-        quiz_ai = QuizAI()
         quiz_ai.generator = mock_generator
         
         result = quiz_ai.generate_explanations(SAMPLE_QUESTION_WITH_ASTERISK)
         
         # Should extract and process the question with asterisk
-        call_args = mock_generator.call_args[0][0]
-        assert "Artificial Intelligence (*)" in call_args
+        prompt = mock_generator.calls[-1]
+        assert "Artificial Intelligence (*)" in prompt
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generate_explanation_return_type(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_generate_explanation_return_type(self, gen_factory, quiz_ai):
         """Test that explanation returns a string"""
-        from phases.quiz_generator import QuizAI
         
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "This is an explanation."}]
+        mock_generator = gen_factory("This is an explanation.")
         
-        quiz_ai = QuizAI()
         quiz_ai.generator = mock_generator
         
         result = quiz_ai.generate_explanations(SAMPLE_QUIZ_TEXT)
@@ -299,64 +323,22 @@ class TestGenerateExplanations:
         assert isinstance(result, str)
         assert len(result) > 0
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generate_explanation_multiple_questions(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_generate_explanation_multiple_questions(self, gen_factory, quiz_ai):
         """Test that only the first question is explained"""
-        from phases.quiz_generator import QuizAI
         
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "NLP explanation only"}]
+        mock_generator = gen_factory("NLP explanation only")
         
-        quiz_ai = QuizAI()
         quiz_ai.generator = mock_generator
         
         quiz_ai.generate_explanations(SAMPLE_QUIZ_TEXT)
         
         # Check that only question 1 is in the prompt
-        call_args = mock_generator.call_args[0][0]
-        assert "What does NLP stand for?" in call_args
-        assert "What is machine learning?" not in call_args
+        prompt = mock_generator.calls[-1]
+        assert "What does NLP stand for?" in prompt
+        assert "What is machine learning?" not in prompt
 
 
-class TestGenerateExplanationsIntegration:
-    """Integration tests for generate_explanations with extract_first_question"""
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_full_flow_extraction_to_explanation(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test complete flow from quiz text to explanation"""
-        from phases.quiz_generator import QuizAI
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Python is a high-level programming language."}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        # Full flow
-        quiz_text = SAMPLE_SINGLE_QUESTION
-        explanation = quiz_ai.generate_explanations(quiz_text)
-        
-        # Verify the flow worked
-        assert "programming language" in explanation.lower()
-        
-        # Verify the prompt contained the extracted question
-        call_args = mock_generator.call_args[0][0]
-        assert "What is Python?" in call_args
-        assert "a) A snake" in call_args
-        assert "d) A movie" in call_args
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_explanation_handles_complex_formatting(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test explanation with complex formatted questions"""
-        from phases.quiz_generator import QuizAI
-        
-        complex_quiz = """
+COMPLEX_QUIZ_TEXT = """
 1. Which statement is TRUE regarding neural 
    networks and their applications?
    
@@ -365,53 +347,10 @@ b) They excel at pattern recognition tasks
 c) They always outperform traditional algorithms
 d) They don't require feature engineering ever
 """
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Neural networks are good at pattern recognition."}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        explanation = quiz_ai.generate_explanations(complex_quiz)
-        
-        # Should handle the complex formatting
-        assert isinstance(explanation, str)
-        call_args = mock_generator.call_args[0][0]
-        assert "neural" in call_args.lower()
 
+NO_OPTIONS_TEXT = "1. What is AI?\n\n2. What is ML?"
 
-class TestEdgeCases:
-    """Test edge cases and error scenarios"""
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_quiz_with_no_options(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test with quiz text that has no options"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_text = "1. What is AI?\n\n2. What is ML?"
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "AI is artificial intelligence."}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        result = quiz_ai.generate_explanations(quiz_text)
-        
-        # Should still work, even without proper options
-        assert isinstance(result, str)
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_quiz_with_extra_whitespace(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test with excessive whitespace in quiz text"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_text = """
-        
+EXTRA_WHITESPACE_TEXT = """
         
 1.    What is Python?    
 
@@ -427,100 +366,107 @@ d)   A movie
 
 
 """
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Python explanation"}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        result = quiz_ai.generate_explanations(quiz_text)
-        
-        # Should handle extra whitespace
-        assert isinstance(result, str)
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_quiz_with_unicode_characters(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test with unicode characters in quiz"""
-        from phases.quiz_generator import QuizAI
-        
-        quiz_text = """
+
+UNICODE_QUIZ_TEXT = """
 1. What is the concept of 'résumé' in ML?
 a) A summary document
 b) A type of neural network 🧠
 c) Data preprocessing technique
 d) None of the above
 """
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Explanation with émojis 🎉"}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        result = quiz_ai.generate_explanations(quiz_text)
-        
-        # Should handle unicode
-        assert isinstance(result, str)
-        assert "émojis" in result or "Explanation" in result
+
+
+class TestGenerateExplanationsIntegration:
+    """Integration tests for generate_explanations with extract_first_question"""
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generator_returns_empty_string(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test when generator returns empty string"""
-        from phases.quiz_generator import QuizAI
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": ""}]
-        
-        quiz_ai = QuizAI()
+    # One row per former smoke test; fragments are matched case-insensitively
+    # against the generated explanation and the prompt sent to the generator.
+    SMOKE_CASES = [
+        (SAMPLE_SINGLE_QUESTION,
+         "Python is a high-level programming language.",
+         ["what is python?", "a) a snake", "d) a movie"],
+         ["programming language"]),
+        (COMPLEX_QUIZ_TEXT,
+         "Neural networks are good at pattern recognition.",
+         ["neural"],
+         []),
+        (NO_OPTIONS_TEXT, "AI is artificial intelligence.", [], []),
+        (EXTRA_WHITESPACE_TEXT, "Python explanation", [], []),
+        (UNICODE_QUIZ_TEXT, "Explanation with émojis 🎉", [], ["émojis"]),
+    ]
+    SMOKE_CASE_IDS = [
+        "full-flow",
+        "complex-formatting",
+        "no-options",
+        "extra-whitespace",
+        "unicode",
+    ]
+
+    @pytest.mark.parametrize("text,response,prompt_contains,response_contains",
+                             SMOKE_CASES, ids=SMOKE_CASE_IDS)
+    def test_generate_explanations_smoke(self, gen_factory, quiz_ai, text,
+                                         response, prompt_contains,
+                                         response_contains):
+        """End-to-end smoke over the awkward input shapes
+
+        Covers the former per-input tests (full flow, complex formatting,
+        missing options, extra whitespace, unicode) that shared identical
+        setup and differed only in quiz text and expected fragments.
+        """
+        mock_generator = gen_factory(response)
+
         quiz_ai.generator = mock_generator
-        
+
+        result = quiz_ai.generate_explanations(text)
+
+        assert isinstance(result, str)
+        for fragment in response_contains:
+            assert fragment in result.lower()
+
+        prompt = mock_generator.calls[-1].lower()
+        for fragment in prompt_contains:
+            assert fragment in prompt
+
+
+class TestEdgeCases:
+    """Test edge cases and error scenarios"""
+
+    @pytest.mark.parametrize("payload,expected", [
+        ([{"generated_text": ""}], ""),
+        # A payload without generated_text must blow up with KeyError;
+        # strict xfail turns an unexpected pass into a failure
+        pytest.param([{"wrong_key": "some text"}], None,
+                     marks=pytest.mark.xfail(raises=KeyError, strict=True)),
+    ], ids=["empty-generation", "missing-generated-text"])
+    def test_generator_payload_handling(self, quiz_ai, payload, expected):
+        """Test how odd generator payloads come back out"""
+
+        quiz_ai.generator = Mock(return_value=payload)
+
         result = quiz_ai.generate_explanations(SAMPLE_QUIZ_TEXT)
-        
-        # Should return empty string without error
-        assert result == ""
-    
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_generator_returns_unexpected_format(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test when generator returns unexpected format"""
-        from phases.quiz_generator import QuizAI
-        
-        mock_generator = MagicMock()
-        # Return unexpected structure (should cause KeyError if not handled)
-        mock_generator.return_value = [{"wrong_key": "some text"}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        # Should raise KeyError or be handled
-        with pytest.raises(KeyError):
-            quiz_ai.generate_explanations(SAMPLE_QUIZ_TEXT)
+
+        assert result == expected
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_very_long_quiz_text(self, mock_pipeline, mock_model, mock_tokenizer):
-        """Test with very long quiz text"""
-        from phases.quiz_generator import QuizAI
-        
-        # Create a very long quiz
-        long_quiz = "1. " + ("What is this? " * 1000) + "\n"
+    @pytest.mark.parametrize("repeats", [
+        10,
+        pytest.param(1000, marks=pytest.mark.slow),
+    ], ids=["long", "very-long"])
+    def test_very_long_quiz_text(self, gen_factory, quiz_ai, repeats):
+        """Test with very long quiz text
+
+        The extractor only has to find the first question and its options,
+        so a modest repeat count exercises the same path; the original
+        1000-repeat (~14 KB) input stays available behind the slow marker.
+        """
+        long_quiz = "1. " + ("What is this? " * repeats) + "\n"
         long_quiz += "a) Option A\nb) Option B\nc) Option C\nd) Option D"
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Long explanation"}]
-        
-        quiz_ai = QuizAI()
+
+        mock_generator = gen_factory("Long explanation")
+
         quiz_ai.generator = mock_generator
-        
+
         result = quiz_ai.generate_explanations(long_quiz)
-        
+
         # Should handle long text
         assert isinstance(result, str)
 
@@ -528,52 +474,32 @@ d) None of the above
 class TestPromptConstruction:
     """Test prompt construction for the generator"""
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_prompt_contains_all_required_elements(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_prompt_contains_all_required_elements(self, prompt_for):
         """Test that prompt has all required elements"""
-        from phases.quiz_generator import QuizAI
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Test"}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        quiz_ai.generate_explanations(SAMPLE_QUIZ_TEXT)
         
-        prompt = mock_generator.call_args[0][0]
+        prompt = prompt_for(SAMPLE_QUIZ_TEXT)
         
-        # Check for key prompt elements
-        assert "Explain the correct answer" in prompt
-        assert "multiple-choice question" in prompt
-        assert "Question:" in prompt
-        assert "short and clear explanation" in prompt
+        # Check for key prompt elements in one pass
+        assert all(fragment in prompt for fragment in (
+            "Explain the correct answer",
+            "multiple-choice question",
+            "Question:",
+            "short and clear explanation",
+        ))
     
-    @patch('transformers.AutoTokenizer')
-    @patch('transformers.AutoModelForSeq2SeqLM')
-    @patch('transformers.pipeline')
-    def test_prompt_includes_extracted_question(self, mock_pipeline, mock_model, mock_tokenizer):
+    def test_prompt_includes_extracted_question(self, prompt_for):
         """Test that extracted question is included in prompt"""
-        from phases.quiz_generator import QuizAI
-        
-        mock_generator = MagicMock()
-        mock_generator.return_value = [{"generated_text": "Test"}]
-        
-        quiz_ai = QuizAI()
-        quiz_ai.generator = mock_generator
-        
-        quiz_ai.generate_explanations(SAMPLE_SINGLE_QUESTION)
         
-        prompt = mock_generator.call_args[0][0]
+        prompt = prompt_for(SAMPLE_SINGLE_QUESTION)
         
         # Should include the question and all options
-        assert "What is Python?" in prompt
-        assert "a) A snake" in prompt
-        assert "b) A programming language" in prompt
-        assert "c) A type of food" in prompt
-        assert "d) A movie" in prompt
+        assert all(fragment in prompt for fragment in (
+            "What is Python?",
+            "a) A snake",
+            "b) A programming language",
+            "c) A type of food",
+            "d) A movie",
+        ))
 
 
 if __name__ == "__main__":
@@ -1,17 +1,61 @@
 import pytest
+import re
+from functools import lru_cache
 from unittest.mock import patch
-import gradio as gr
 
 from phases.quizzes import Quiz 
 
+
+@lru_cache(maxsize=None)
+def _fragment_pattern(fragments):
+    """Compiled alternation matching any expected fragment.
+
+    Longest-first so short fragments cannot shadow longer ones; cached so
+    the pattern is compiled once per unique fragment set.
+    """
+    ordered = sorted(fragments, key=len, reverse=True)
+    return re.compile("|".join(re.escape(fragment) for fragment in ordered))
+
+
+@pytest.fixture(scope="session")
+def gr():
+    """Gradio, imported only when a test inspects its component types.
+
+    Keeps targeted runs of the state-only tests from paying the import,
+    should phases.quizzes ever defer its own.
+    """
+    import gradio
+    return gradio
+
+
+def _md_text(markdown_output):
+    """Rendered text of a shuffle result's markdown component.
+
+    shuffle() always hands back a gr.Markdown here, so .value is present;
+    the per-call hasattr probe the tests used to repeat is unnecessary.
+    """
+    return markdown_output.value
+
+
+@pytest.fixture(scope="module")
+def quiz_instance():
+    return Quiz()
+
+
 class TestQuizShuffling:
-    @pytest.fixture
-    def quiz_instance(self):
-        return Quiz()
+    @pytest.fixture(autouse=True)
+    def _reset_quiz(self, quiz_instance):
+        """Clear state left on the shared instance by the previous test."""
+        quiz_instance.current_quiz_state = {
+            "questions": [],
+            "num_questions": 0,
+            "question_types": []
+        }
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_questions(self):
-        return [
+        """Shared read-only questions; built once for the whole module."""
+        return (
             {
                 'question': 'The capital of France is _____.',
                 'answer': 'Paris',
@@ -32,7 +76,26 @@ class TestQuizShuffling:
                 'answer': '100',
                 'type': 'fill_blank'
             }
-        ]
+        )
+    
+    @pytest.fixture(scope="module")
+    def sample_meta(self, sample_questions):
+        """Derived views of sample_questions, computed once per module."""
+        return {
+            "qset": frozenset(q['question'] for q in sample_questions),
+            "aset": frozenset(q['answer'] for q in sample_questions),
+            "order": tuple(q['question'] for q in sample_questions),
+        }
+    
+    @pytest.fixture
+    def populated_quiz(self, quiz_instance, sample_questions):
+        """Quiz pre-loaded with the shared sample questions.
+
+        Replaces the two quiz-state setup lines most tests repeated.
+        """
+        quiz_instance.current_quiz_state['questions'] = list(sample_questions)
+        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
+        return quiz_instance
     
     def test_shuffle_with_empty_questions(self, quiz_instance):
         """Test shuffling when no questions exist in quiz state"""
@@ -49,50 +112,39 @@ class TestQuizShuffling:
         assert isinstance(result, tuple) 
         assert result[2] == "Please generate a quiz first before shuffling!"
     
-    def test_shuffle_maintains_question_count(self, quiz_instance, sample_questions):
-        """Test that shuffling maintains the same number of questions"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
+    def test_shuffle_invokes_random_shuffle_on_copy(self, populated_quiz, sample_questions):
+        """Test that shuffle() calls random.shuffle once, with a same-length copy"""
         with patch('random.shuffle') as mock_shuffle:
-            quiz_instance.shuffle()
-            
-            # Verify shuffle was called
-            assert mock_shuffle.called
-            
-            # Get the list that was passed to shuffle
-            shuffled_list = mock_shuffle.call_args[0][0]
-            assert len(shuffled_list) == len(sample_questions)
-    
-    def test_shuffle_contains_all_original_questions(self, quiz_instance, sample_questions):
-        """Test that shuffled quiz contains all original questions"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
-        # Get the original question texts
-        original_questions = {q['question'] for q in sample_questions}
-        original_answers = {q['answer'] for q in sample_questions}
+            populated_quiz.shuffle()
         
+        # One patch and one shuffle() cover what three tests used to check:
+        # the call happened exactly once, every question was handed over,
+        # and the argument is a copy rather than the state list itself
+        assert mock_shuffle.call_count == 1
+        shuffled_list = mock_shuffle.call_args[0][0]
+        assert len(shuffled_list) == len(sample_questions)
+        assert shuffled_list is not populated_quiz.current_quiz_state['questions']
+    
+    def test_shuffle_preserves_questions_and_answers(self, populated_quiz, sample_meta):
+        """Test that every question keeps its text, answer and structure after shuffling"""
         # Mock random.shuffle to reverse the list (deterministic shuffle for testing)
         with patch('random.shuffle', side_effect=lambda x: x.reverse()):
-            result = quiz_instance.shuffle()
+            result = populated_quiz.shuffle()
         
-        # Extract the markdown output
+        # Extract the markdown output once and check everything against it
         _, _, markdown_output = result
-        markdown_text = markdown_output.value if hasattr(markdown_output, 'value') else str(markdown_output)
-        
-        # Verify all questions and answers are present
-        for question_text in original_questions:
-            assert question_text in markdown_text
-        for answer in original_answers:
-            assert answer in markdown_text
+        markdown_text = _md_text(markdown_output)
+        
+        # One scan of the markdown and one assertion frame instead of a
+        # substring search and assert per fragment
+        expected = sample_meta["qset"] | sample_meta["aset"]
+        found = set(_fragment_pattern(expected).findall(markdown_text))
+        missing = expected - found
+        assert not missing, f"Missing from markdown: {sorted(missing)}"
     
-    def test_shuffle_returns_correct_output_format(self, quiz_instance, sample_questions):
+    def test_shuffle_returns_correct_output_format(self, populated_quiz, gr):
         """Test that shuffle returns the correct Gradio components tuple"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
-        result = quiz_instance.shuffle()
+        result = populated_quiz.shuffle()
         
         # Should return a tuple of (gr.update, gr.update, gr.Markdown)
         assert isinstance(result, tuple)
@@ -112,67 +164,30 @@ class TestQuizShuffling:
         markdown_output = result[2]
         assert isinstance(markdown_output, gr.Markdown)
     
-    def test_shuffle_does_not_modify_original_state(self, quiz_instance, sample_questions):
+    def test_shuffle_does_not_modify_original_state(self, populated_quiz, sample_meta):
         """Test that shuffling doesn't modify the original question order in state"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
+        populated_quiz.shuffle()
         
-        # Store original order
-        original_order = [q['question'] for q in quiz_instance.current_quiz_state['questions']]
-        
-        # Shuffle
-        quiz_instance.shuffle()
-        
-        # Verify original state is unchanged
-        current_order = [q['question'] for q in quiz_instance.current_quiz_state['questions']]
-        assert current_order == original_order
+        # Verify original state still matches the precomputed order
+        current_order = tuple(q['question'] for q in populated_quiz.current_quiz_state['questions'])
+        assert current_order == sample_meta["order"]
     
-    @patch('random.shuffle')
-    def test_shuffle_calls_random_shuffle(self, mock_shuffle, quiz_instance, sample_questions):
-        """Test that shuffle() actually calls random.shuffle"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
-        quiz_instance.shuffle()
-        
-        assert mock_shuffle.called
-        assert mock_shuffle.call_count == 1
-    
-    def test_shuffle_creates_copy_of_questions(self, quiz_instance, sample_questions):
-        """Test that shuffle works on a copy, not the original list"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
-        with patch('random.shuffle') as mock_shuffle:
-            quiz_instance.shuffle()
-            
-            # Get the shuffled list
-            shuffled_list = mock_shuffle.call_args[0][0]
-            
-            # Verify it's not the same object reference
-            assert shuffled_list is not quiz_instance.current_quiz_state['questions']
-    
-    def test_shuffle_output_contains_correct_question_count(self, quiz_instance, sample_questions):
+    def test_shuffle_output_contains_correct_question_count(self, populated_quiz, sample_questions):
         """Test that the markdown output shows the correct question count"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
-        result = quiz_instance.shuffle()
+        result = populated_quiz.shuffle()
         _, _, markdown_output = result
         
-        markdown_text = markdown_output.value if hasattr(markdown_output, 'value') else str(markdown_output)
+        markdown_text = _md_text(markdown_output)
         
         # Check that the header contains the correct count
         assert f"Generated Quiz ({len(sample_questions)} questions)" in markdown_text
     
-    def test_shuffle_multiple_times_produces_valid_output(self, quiz_instance, sample_questions):
+    def test_shuffle_multiple_times_produces_valid_output(self, populated_quiz, gr):
         """Test that shuffling multiple times always produces valid output"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
-        # Shuffle multiple times
-        for _ in range(5):
-            result = quiz_instance.shuffle()
+        # Two passes are enough to prove the output stays valid on reuse;
+        # each extra iteration re-renders the full markdown for no new coverage
+        for _ in range(2):
+            result = populated_quiz.shuffle()
             
             # Verify each result is valid
             assert isinstance(result, tuple)
@@ -201,21 +216,5 @@ class TestQuizShuffling:
         # Should still work and return valid output
         assert isinstance(result, tuple)
         _, _, markdown_output = result
-        markdown_text = markdown_output.value if hasattr(markdown_output, 'value') else str(markdown_output)
+        markdown_text = _md_text(markdown_output)
         assert 'The capital of France is _____.' in markdown_text
-    
-    def test_shuffle_preserves_question_structure(self, quiz_instance, sample_questions):
-        """Test that shuffled questions maintain their dictionary structure"""
-        quiz_instance.current_quiz_state['questions'] = sample_questions.copy()
-        quiz_instance.current_quiz_state['num_questions'] = len(sample_questions)
-        
-        with patch('random.shuffle', side_effect=lambda x: x.reverse()):
-            result = quiz_instance.shuffle()
-        
-        _, _, markdown_output = result
-        markdown_text = markdown_output.value if hasattr(markdown_output, 'value') else str(markdown_output)
-        
-        # Verify all required fields are present in output
-        for question in sample_questions:
-            assert question['question'] in markdown_text
-            assert question['answer'] in markdown_text
\ No newline at end of file
@@ -1,3 +1,5 @@
+import random
+
 from terminal.shuffle import shuffle_answers
 
 def test_shuffle_answers_preserves_correct_answer():
@@ -25,18 +27,19 @@ def test_shuffle_answers_does_not_mutate_original():
     assert original["options"] == ["3", "4", "5", "6"], "Original question was modified"
 
 def test_shuffle_answers_changes_order_most_of_the_time():
-    # There is a small chance order may match by luck, so we repeat.
+    # Two seeded calls replace the old ten-round Monte-Carlo loop: fixed
+    # seeds give two specific permutations, so distinct outputs prove the
+    # RNG is actually consulted without any repeat-and-hope sampling.
     question = {
         "question": "Test shuffle",
         "options": ["A", "B", "C", "D"],
         "answer": "A"
     }
 
-    orders = set()
-    for _ in range(10):
-        shuffled = shuffle_answers(question)
-        orders.add(tuple(shuffled["options"]))
+    random.seed(0)
+    first = tuple(shuffle_answers(question)["options"])
+    random.seed(1)
+    second = tuple(shuffle_answers(question)["options"])
 
-    # More than one unique ordering means shuffling is happening
-    assert len(orders) > 1, "Options are not being shuffled"
+    assert first != second, "Options are not being shuffled"
 